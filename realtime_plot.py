@@ -1,14 +1,15 @@
 import logging
-import queue
+import sys
 import threading
 import time
 from collections import deque
 import hid
 import matplotlib.animation as animation
 import matplotlib.pyplot as plt
+import numpy as np
 
 # Importing from our new core file
-from ut61eplus import UT61EPLUS, data_collector
+from ut61eplus import UT61EPLUS, io_collector, packet_decoder
 
 
 # --- CONFIGURATION ---
@@ -17,69 +18,134 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 MAX_PLOT_POINTS = 100
 GUI_UPDATE_INTERVAL_MS = 100
 
+# Fewer forced GIL handoffs between the collector thread and the GUI:
+# hidapi releases the GIL during USB reads anyway, so the default 5 ms
+# switch interval only adds context switches (visible as Rate dips).
+sys.setswitchinterval(0.05)
+
 # --- Main Code ---
 dmm = None
-data_collector_thread = None
+pipeline_threads = []
 
 try:
     dmm = UT61EPLUS()
-    data_queue = queue.Queue()
+    # deque append/popleft are atomic, so the pipeline stages and the
+    # GUI callback never contend on a lock the way queue.Queue does.
+    # Stage 1 (I/O) feeds raw chunks to stage 2 (decoder), which feeds
+    # rows to the GUI; only the decoder touches the packet parser.
+    raw_queue = deque(maxlen=4096)
+    data_queue = deque(maxlen=4096)
     stop_event = threading.Event()
 
-    data_collector_thread = threading.Thread(target=data_collector, args=(dmm, data_queue, stop_event))
-    data_collector_thread.start()
+    pipeline_threads = [
+        threading.Thread(target=io_collector, args=(dmm, raw_queue, stop_event)),
+        threading.Thread(target=packet_decoder, args=(dmm, raw_queue, data_queue, stop_event)),
+    ]
+    for t in pipeline_threads:
+        t.start()
 
-    x_data, y_data = deque(maxlen=MAX_PLOT_POINTS), deque(maxlen=MAX_PLOT_POINTS)
-    fig, ax = plt.subplots()
-    line, = ax.plot([], [], 'r-')
+    # Preallocated ring buffers: set_data gets contiguous ndarray views,
+    # so matplotlib skips its per-frame list-to-array conversion.
+    x_buf = np.empty(MAX_PLOT_POINTS, dtype=np.float64)
+    y_buf = np.empty(MAX_PLOT_POINTS, dtype=np.float64)
+    head = 0; count = 0
+    # constrained_layout solves the layout once up front; nothing in the
+    # blitted update path triggers a reflow (the status line is a text
+    # artist whose length changes don't affect layout).
+    fig, ax = plt.subplots(constrained_layout=True)
+    line, = ax.plot([], [], 'r-', animated=True)
     ax.set_xlabel("Time")
     ax.grid(True)
     fig.canvas.manager.set_window_title('UT61E+ Real-Time Data')
 
-    last_time = time.time(); sample_count = 0; rate = 0
-    
-    # This variable will store the latest data for title updates
-    last_data = {}
+    # With blit=True only animated artists are redrawn each frame, so the
+    # status line lives in an animated text artist instead of the title.
+    title_artist = ax.text(0.01, 0.99, '', transform=ax.transAxes,
+                           va='top', fontsize=12, animated=True)
+
+    last_time = time.monotonic(); sample_count = 0; rate = 0
+
+    # This variable will store the latest row for title updates
+    last_data = None
+    last_mode = None; last_unit = None
+    y_min_seen = float('inf'); y_max_seen = float('-inf')
 
     def update(frame):
-        global last_time, sample_count, rate, last_data
+        global last_time, sample_count, rate, last_data, last_mode, last_unit, head, count
+        global y_min_seen, y_max_seen
 
+        # One timestamp per frame: everything drained below arrived
+        # within the last GUI tick, so a shared stamp is accurate enough
+        # and saves a clock syscall per sample.
+        now = time.time()
         points_processed = 0
-        while not data_queue.empty():
-            data = data_queue.get()
-            last_data = data # Store the latest data
-            y_data.append(data['value'] if not data['overload'] else 0)
-            x_data.append(time.time())
+        while data_queue:
+            data = data_queue.popleft()
+            last_data = data # Store the latest row
+            y = data.value if not data.overload else 0
+            if y < y_min_seen: y_min_seen = y
+            if y > y_max_seen: y_max_seen = y
+            y_buf[head] = y
+            x_buf[head] = now
+            head = (head + 1) % MAX_PLOT_POINTS
+            count = min(count + 1, MAX_PLOT_POINTS)
             points_processed += 1
 
         if points_processed > 0:
             sample_count += points_processed
-            current_time = time.time()
+            current_time = time.monotonic() # NTP-safe rate window
             if current_time - last_time >= 1.0:
                 rate = sample_count / (current_time - last_time)
                 sample_count = 0; last_time = current_time
 
-            line.set_data(x_data, y_data)
-            ax.relim(); ax.autoscale_view()
-            
-            # Use the new keys from the dictionary
-            status_hold = "HOLD" if last_data.get('hold') else "Live"
-            status_range = last_data.get('range', 'N/A')
-            title = f"Mode: {last_data.get('mode')} ({status_range}) | {status_hold} | Rate: {rate:.1f} meas/s"
-            ax.set_title(title, fontsize=12)
-            ax.set_ylabel(f"Value ({last_data.get('unit') or 'N/A'})")
-            fig.tight_layout()
+            # While filling, head == count and the data is already in
+            # order; once full, stitch the two halves of the ring.
+            if count < MAX_PLOT_POINTS:
+                x_view, y_view = x_buf[:count], y_buf[:count]
+            else:
+                x_view = np.concatenate((x_buf[head:], x_buf[:head]))
+                y_view = np.concatenate((y_buf[head:], y_buf[:head]))
+            line.set_data(x_view, y_view)
+
+            # Rescale manually instead of relim/autoscale: the running
+            # min/max are maintained per appended sample, so no artist
+            # walk or O(n) array scan happens per frame, and limits only
+            # change when data actually leaves the view (5% margin).
+            needs_redraw = False
+            cur_lo, cur_hi = ax.get_ylim()
+            if y_min_seen < cur_lo or y_max_seen > cur_hi:
+                margin = 0.05 * (y_max_seen - y_min_seen) or 0.5
+                ax.set_ylim(y_min_seen - margin, y_max_seen + margin)
+                needs_redraw = True
+            cur_left, cur_right = ax.get_xlim()
+            if x_view[0] < cur_left or x_view[-1] > cur_right:
+                ax.set_xlim(x_view[0], x_view[-1] + 1.0)
+                needs_redraw = True
+
+            # Static decorations only change when the meter mode does.
+            if last_data.mode != last_mode or last_data.unit != last_unit:
+                last_mode, last_unit = last_data.mode, last_data.unit
+                ax.set_ylabel(f"Value ({last_data.unit or 'N/A'})")
+                needs_redraw = True
+
+            status_hold = "HOLD" if last_data.hold else "Live"
+            title_artist.set_text(
+                f"Mode: {last_data.mode} ({last_data.range}) | {status_hold} | Rate: {rate:.1f} meas/s")
+
+            if needs_redraw:
+                fig.canvas.draw_idle()  # re-captures the blit background
 
-        return line,
+        return line, title_artist
 
-    ani = animation.FuncAnimation(fig, update, blit=False, interval=GUI_UPDATE_INTERVAL_MS, save_count=0)
+    ani = animation.FuncAnimation(fig, update, blit=True, interval=GUI_UPDATE_INTERVAL_MS, save_count=0)
     plt.show()
 
 except hid.HIDException as e: log.error(f"HID Error: {e}")
 except KeyboardInterrupt: log.info("Program stopped.")
 except Exception: log.error("Unexpected error:", exc_info=True)
 finally:
-    if data_collector_thread:
+    if pipeline_threads:
         stop_event.set()
-        data_collector_thread.join()
+        for t in pipeline_threads:
+            t.join()
     if dmm: dmm.close()
@@ -1,8 +1,7 @@
+import csv
 import logging
 import time
-import os
-import pandas as pd
-from ut61eplus import UT61EPLUS
+from ut61eplus import UT61EPLUS, MeasurementRow
 
 # --- CONFIGURATION ---
 log = logging.getLogger(__name__)
@@ -51,31 +50,36 @@ def example_log_to_csv(duration_seconds=10):
     print(f"\n--- Example 3: Logging to CSV for {duration_seconds} seconds ---")
     
     CSV_FILEPATH = "dmm_log.csv"
-    BUFFER_SIZE = 50 # Write to file every 50 data points
-    
+    BUFFER_SIZE = 500 # Write to file every 500 data points
+
     dmm = None
     data_buffer = []
 
+    # One persistent writer instead of spinning up a DataFrame and
+    # re-checking the file per flush; header only for a fresh file.
+    csv_file = open(CSV_FILEPATH, 'a', newline='', buffering=1 << 16)
+    writer = csv.writer(csv_file)
+    if csv_file.tell() == 0:
+        writer.writerow(MeasurementRow._fields)
+
     def write_buffer_to_csv():
-        nonlocal data_buffer
         if not data_buffer:
             return
-        
-        df = pd.DataFrame(data_buffer)
-        df.to_csv(CSV_FILEPATH, mode='a', header=not os.path.exists(CSV_FILEPATH), index=False)
+
+        writer.writerows(data_buffer)
         log.info(f"Wrote {len(data_buffer)} rows to {CSV_FILEPATH}")
-        data_buffer = []
+        data_buffer.clear()
 
     try:
         dmm = UT61EPLUS()
         log.info(f"Starting data collection... Press Ctrl+C to stop.")
         
-        start_time = time.time()
-        while time.time() - start_time < duration_seconds:
+        deadline = time.monotonic() + duration_seconds
+        while time.monotonic() < deadline:
             try:
                 measurement = dmm.take_measurement()
                 if measurement:
-                    data_buffer.append(measurement.to_dict())
+                    data_buffer.append(measurement.to_row())
                 
                 if len(data_buffer) >= BUFFER_SIZE:
                     write_buffer_to_csv()
@@ -87,6 +91,7 @@ def example_log_to_csv(duration_seconds=10):
     finally:
         log.info("Shutting down, saving remaining buffer...")
         write_buffer_to_csv()
+        csv_file.close()
         if dmm:
             dmm.close()
 
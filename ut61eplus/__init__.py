@@ -1,2 +1,5 @@
 from .ut61eplus_core import UT61EPLUS
+from .ut61eplus_core import MeasurementRow
 from .ut61eplus_core import data_collector
+from .ut61eplus_core import io_collector
+from .ut61eplus_core import packet_decoder
@@ -1,12 +1,24 @@
-import decimal
 import logging
+import math
 import time
+from collections import namedtuple
 import hid
+import numpy as np
 
 log = logging.getLogger(__name__)
 
+# Immutable per-sample record: cheaper to build and queue than a dict,
+# and pandas can ingest a list of them via DataFrame.from_records.
+MeasurementRow = namedtuple('MeasurementRow', [
+    'value', 'unit', 'mode', 'range', 'overload', 'hold', 'min_max',
+    'rel', 'hv_warning', 'bat_low'])
+
 class Measurement:
     """Class for storing and decoding a single measurement from the multimeter."""
+    __slots__ = ('raw_bytes', 'mode', 'range_char', '_display_bytes', 'is_overload',
+                 'is_max', 'is_min', 'is_hold', 'is_rel', 'is_auto_range',
+                 'has_battery_warning', 'has_hv_warning', 'is_max_peak',
+                 'is_min_peak', 'value', 'display_unit', 'unit')
     _MODE = ['ACV', 'ACmV', 'DCV', 'DCmV', 'Hz', '%', 'OHM', 'CONT', 'DIDOE', 'CAP', '°C', '°F', 'DCuA', 'ACuA', 'DCmA',
              'ACmA', 'DCA', 'ACA', 'HFE', 'Live', 'NCV', 'LozV', 'ACA', 'DCA', 'LPF', 'AC/DC', 'LPF', 'AC+DC', 'LPF',
              'AC+DC2', 'INRUSH']
@@ -22,62 +34,128 @@ class Measurement:
               'OHM': {'0': 'Ω', '1': 'kΩ', '2': 'kΩ', '3': 'kΩ', '4': 'MΩ', '5': 'MΩ', '6': 'MΩ'},
               '°C': {'0': '°C', '1': '°C'}, '°F': {'0': '°F', '1': '°F'}, 'HFE': {'0': 'B'}, 'NCV': {'0': 'NCV'}}
     _OVERLOAD = {'.OL', 'O.L', 'OL.', 'OL', '-.OL', '-O.L', '-OL.', '-OL'}
-    _EXPONENTS = {'M': 6, 'k': 3, 'm': -3, 'u': -6, 'n': -9}
+    _OVERLOAD_BYTES = frozenset(s.encode('ascii') for s in _OVERLOAD)
+    _EXP_MULT = {'M': 1e6, 'k': 1e3, 'm': 1e-3, 'u': 1e-6, 'n': 1e-9}
+    _MODE_ARR = np.array(_MODE, dtype=object)
+    _FLAG_MASKS = np.array([8, 4, 2, 1], dtype=np.uint8)
+
+    # _UNITS flattened to a 2D table indexed by mode byte and range digit:
+    # one list index each instead of two dict probes plus a chr() call.
+    # Modes sharing a name (ACA/DCA/LPF appear more than once in _MODE)
+    # get the same row filled for every occurrence.
+    _UNIT_TABLE = [[None] * 8 for _ in _MODE]
+    for _i, _m in enumerate(_MODE):
+        for _k, _v in _UNITS.get(_m, {}).items():
+            _UNIT_TABLE[_i][int(_k)] = _v
+    del _i, _m, _k, _v
 
     def __init__(self, b: bytes):
-        if not isinstance(b, bytes) or len(b) < 14:
+        if not isinstance(b, (bytes, bytearray, memoryview)) or len(b) < 14:
             raise TypeError("Measurement requires a minimum of 14 bytes for initialization.")
-        
+
         self.raw_bytes = b
-        self.mode = self._MODE[b[0]]
+        mode_idx = b[0]
+        range_idx = b[1] - 0x30
+        self.mode = self._MODE[mode_idx]
         self.range_char = chr(b[1])
-        self.display = b[2:9].decode('ASCII', errors='ignore').replace(' ', '')
-        self.is_overload = self.display in self._OVERLOAD
+        # translate drops the pad spaces in one C-level pass; overload
+        # matching and float parsing both work on the raw bytes, so the
+        # str decode is deferred to the display property.
+        self._display_bytes = bytes(b[2:9]).translate(None, b' ')
+        self.is_overload = self._display_bytes in self._OVERLOAD_BYTES
         
-        # Main flags
-        self.is_max = (b[11] & 8) > 0
-        self.is_min = (b[11] & 4) > 0
-        self.is_hold = (b[11] & 2) > 0
-        self.is_rel = (b[11] & 1) > 0
-        self.is_auto_range = (b[12] & 4) == 0
-        self.has_battery_warning = (b[12] & 2) > 0
-        self.has_hv_warning = (b[12] & 1) > 0
-        self.is_max_peak = (b[13] & 4) > 0
-        self.is_min_peak = (b[13] & 2) > 0
+        # Main flags: read each flag byte once into a local int
+        flags = b[11]
+        self.is_max = (flags & 8) > 0
+        self.is_min = (flags & 4) > 0
+        self.is_hold = (flags & 2) > 0
+        self.is_rel = (flags & 1) > 0
+        state = b[12]
+        self.is_auto_range = (state & 4) == 0
+        self.has_battery_warning = (state & 2) > 0
+        self.has_hv_warning = (state & 1) > 0
+        peak = b[13]
+        self.is_max_peak = (peak & 4) > 0
+        self.is_min_peak = (peak & 2) > 0
         
+        # The end consumer is always a float, so parse directly instead of
+        # going through an intermediate decimal.Decimal; float() takes
+        # the raw ASCII bytes as-is.
         try:
-            self.decimal_value = decimal.Decimal(self.display)
-        except decimal.InvalidOperation:
-            self.decimal_value = decimal.Decimal('NaN')
+            self.value = float(self._display_bytes)
+        except ValueError:
+            self.value = math.nan
 
-        self.display_unit = self._UNITS.get(self.mode, {}).get(self.range_char)
+        self.display_unit = self._UNIT_TABLE[mode_idx][range_idx] if 0 <= range_idx < 8 else None
         self.unit = self.display_unit
 
-        if self.unit and len(self.unit) > 0 and self.unit[0] in self._EXPONENTS and not self.is_overload:
-            self.decimal_value = self.decimal_value.scaleb(self._EXPONENTS[self.unit[0]])
+        if self.unit and self.unit[0] in self._EXP_MULT and not self.is_overload:
+            self.value *= self._EXP_MULT[self.unit[0]]
             self.unit = self.unit[1:]
 
-    def to_dict(self):
-        """Returns all measurement data in the requested dictionary format."""
+    @property
+    def display(self) -> str:
+        """Space-stripped display text, decoded from bytes on access."""
+        return self._display_bytes.decode('ASCII', errors='ignore')
+
+    @classmethod
+    def decode_batch(cls, raw: np.ndarray) -> dict:
+        """Vectorized decode of N raw packets into SoA columns.
+
+        `raw` is a numpy uint8 array of shape (N, 14) holding one packet
+        per row. All flag columns are computed with array-wide bit masks
+        instead of per-sample Python bit tests, which is far cheaper when
+        decoding accumulated packets for CSV logging or offline analysis.
+        Returns a dict of per-field numpy arrays keyed like the
+        Measurement attributes.
+        """
+        raw = np.asarray(raw, dtype=np.uint8)
+        if raw.ndim != 2 or raw.shape[1] < 14:
+            raise TypeError("decode_batch requires an array of shape (N, 14).")
+
+        flags = (raw[:, 11:12] & cls._FLAG_MASKS) > 0
+        # latin-1 keeps a 1:1 byte-to-char mapping, so row offsets stay aligned
+        text = raw[:, 2:9].tobytes().decode('latin-1')
+        displays = [text[i * 7:i * 7 + 7].replace(' ', '') for i in range(len(raw))]
+        return {
+            'mode': cls._MODE_ARR[raw[:, 0]],
+            'range_char': np.array([chr(c) for c in raw[:, 1]], dtype=object),
+            'display': np.array(displays, dtype=object),
+            'is_overload': np.array([d in cls._OVERLOAD for d in displays], dtype=bool),
+            'is_max': flags[:, 0],
+            'is_min': flags[:, 1],
+            'is_hold': flags[:, 2],
+            'is_rel': flags[:, 3],
+            'is_auto_range': (raw[:, 12] & 4) == 0,
+            'has_battery_warning': (raw[:, 12] & 2) > 0,
+            'has_hv_warning': (raw[:, 12] & 1) > 0,
+            'is_max_peak': (raw[:, 13] & 4) > 0,
+            'is_min_peak': (raw[:, 13] & 2) > 0,
+        }
+
+    def to_row(self) -> MeasurementRow:
+        """Returns the measurement data as a lightweight MeasurementRow tuple."""
         min_max_status = None
         if self.is_max: min_max_status = 'max'
         elif self.is_min: min_max_status = 'min'
         elif self.is_max_peak: min_max_status = 'p-max'
         elif self.is_min_peak: min_max_status = 'p-min'
-        
-        val = self.decimal_value
-        return {
-            'value': float(val) if not self.is_overload and not val.is_nan() else 0.0,
-            'unit': self.unit,
-            'mode': self.mode,
-            'range': 'AUTO' if self.is_auto_range else 'MANUAL',
-            'overload': self.is_overload,
-            'hold': self.is_hold,
-            'min_max': min_max_status,
-            'rel': self.is_rel,
-            'hv_warning': self.has_hv_warning,
-            'bat_low': self.has_battery_warning
-        }
+
+        return MeasurementRow(
+            value=0.0 if self.is_overload or math.isnan(self.value) else self.value,
+            unit=self.unit,
+            mode=self.mode,
+            range='AUTO' if self.is_auto_range else 'MANUAL',
+            overload=self.is_overload,
+            hold=self.is_hold,
+            min_max=min_max_status,
+            rel=self.is_rel,
+            hv_warning=self.has_hv_warning,
+            bat_low=self.has_battery_warning)
+
+    def to_dict(self):
+        """Returns all measurement data in the requested dictionary format."""
+        return self.to_row()._asdict()
 
 class UT61EPLUS:
     CP2110_VID = 0x10c4
@@ -85,9 +163,20 @@ class UT61EPLUS:
     _SEQUENCE_SEND_DATA = bytes.fromhex('AB CD 03 5E 01 D9')
     _SEQUENCE_SEND_CMD = bytes.fromhex('AB CD 03')
     _COMMANDS = {
-        'min_max': 65, 'not_min_max': 66, 'range': 70, 'auto': 71, 'rel': 72, 
+        'min_max': 65, 'not_min_max': 66, 'range': 70, 'auto': 71, 'rel': 72,
         'select2': 73, 'hold': 74, 'lamp': 75, 'select1': 76, 'p_min_max': 77, 'not_peak': 78
     }
+    # Complete HID frames (length prefix + header + code + checksum),
+    # built once so the command path does no per-call assembly.
+    _COMMAND_FRAMES = {name: bytes([6, 0xAB, 0xCD, 0x03, code, (code + 379) >> 8, (code + 379) & 0xff])
+                       for name, code in _COMMANDS.items()}
+    _DATA_FRAME = bytes([len(_SEQUENCE_SEND_DATA)]) + _SEQUENCE_SEND_DATA
+    # Full wire size of a measurement response: AB CD header + length
+    # byte + 14 data bytes + 2 checksum bytes.
+    _MEASUREMENT_FRAME_LEN = 19
+
+    # Framing parser states
+    _WAIT_AB, _WAIT_CD, _READ_LEN, _READ_BODY = range(4)
 
     def __init__(self):
         log.info('Connecting to UT61E+...')
@@ -96,46 +185,92 @@ class UT61EPLUS:
         self.dev.send_feature_report([0x41, 0x01])
         self.dev.send_feature_report([0x50, 0x00, 0x00, 0x25, 0x80, 0x00, 0x00, 0x03, 0x00, 0x00])
         self.dev.send_feature_report([0x43, 0x02])
+        self.dev.set_nonblocking(1)
         log.info('Device successfully configured.')
         self.read_buffer = bytearray()
+        self._parse_state = self._WAIT_AB
+        self._expected_len = 0
+        self._packet_body = bytearray()
 
-    def _write(self, b: bytes):
-        self.dev.write(bytearray([len(b)]) + b)
+    def _try_parse(self) -> bytes:
+        """Feeds buffered bytes through the framing state machine.
 
-    def _read_packet(self, timeout=1.0) -> bytes:
-        timeout_start = time.time()
-        while time.time() - timeout_start < timeout:
-            start_index = self.read_buffer.find(b'\xab\xcd')
-            if start_index != -1 and len(self.read_buffer) > start_index + 2:
-                payload_len = self.read_buffer[start_index + 2]
-                full_packet_len = 3 + payload_len
-                if len(self.read_buffer) >= start_index + full_packet_len:
-                    packet = self.read_buffer[start_index: start_index + full_packet_len]
-                    self.read_buffer = self.read_buffer[start_index + full_packet_len:]
-                    if sum(packet[:-2]) == (packet[-2] << 8) + packet[-1]: return bytes(packet[3:])
+        Returns the payload of the first complete packet with a valid
+        checksum (including the two trailing checksum bytes, as before),
+        or None if the buffer does not yet hold a full packet. Consumed
+        bytes are discarded from the buffer in a single `del` at the end,
+        so no rescanning or reallocation happens between calls.
+        """
+        buf = self.read_buffer
+        state = self._parse_state
+        body = self._packet_body
+        packet = None
+        i, n = 0, len(buf)
+        while i < n:
+            byte = buf[i]
+            i += 1
+            if state == self._WAIT_AB:
+                if byte == 0xAB: state = self._WAIT_CD
+            elif state == self._WAIT_CD:
+                if byte == 0xCD: state = self._READ_LEN
+                elif byte != 0xAB: state = self._WAIT_AB
+            elif state == self._READ_LEN:
+                self._expected_len = byte
+                body.clear()
+                state = self._READ_BODY if byte else self._WAIT_AB
+            else:  # _READ_BODY
+                body.append(byte)
+                if len(body) == self._expected_len:
+                    state = self._WAIT_AB
+                    # Zero-copy checksum: sum over a memoryview slice
+                    # instead of materializing body[:-2] as a bytearray.
+                    with memoryview(body) as mv:
+                        expected = int.from_bytes(mv[-2:], 'big')
+                        actual = 0xAB + 0xCD + self._expected_len + sum(mv[:-2])
+                    if actual == expected:
+                        packet = bytes(body)
+                        break
                     log.warning("Checksum error! Packet discarded.")
-                    continue
-            raw = self.dev.read(64, 10) # Optimized timeout
-            if raw: self.read_buffer.extend(bytes(raw[1:2]))
-        return None
+        del buf[:i]
+        self._parse_state = state
+        return packet
+
+    def _read_packet(self, timeout=1.0) -> bytes:
+        deadline = time.monotonic() + timeout
+        while True:
+            packet = self._try_parse()
+            if packet is not None:
+                return packet
+            if time.monotonic() >= deadline:
+                return None
+            # Non-blocking read: returns immediately with whatever the
+            # device has, so buffered packets never wait out a timeout.
+            raw = self.dev.read(64)
+            if raw:
+                # CP2110 HID report: byte 0 is the payload length, bytes 1..n are UART data.
+                payload_bytes = raw[0]
+                self.read_buffer.extend(bytes(raw[1:1 + payload_bytes]))
+            else:
+                time.sleep(0.001)
 
     def take_measurement(self):
-        self._write(self._SEQUENCE_SEND_DATA)
+        self.dev.write(self._DATA_FRAME)
         payload = self._read_packet()
-        return Measurement(payload[:-2]) if payload and len(payload) == 16 else None
+        # memoryview slice: Measurement reads the bytes in place instead
+        # of copying off the checksum trailer first.
+        return Measurement(memoryview(payload)[:-2]) if payload and len(payload) == 16 else None
 
     def send_command(self, cmd) -> None:
         """Sends a command to the device."""
-        cmd_code = self._COMMANDS.get(cmd) if isinstance(cmd, str) else cmd
-        if not isinstance(cmd_code, int):
-            raise ValueError(f'Invalid command: {cmd}')
+        frame = self._COMMAND_FRAMES.get(cmd) if isinstance(cmd, str) else None
+        if frame is None:
+            if not isinstance(cmd, int):
+                raise ValueError(f'Invalid command: {cmd}')
+            checksum = cmd + 379
+            frame = bytes([6, 0xAB, 0xCD, 0x03, cmd, checksum >> 8, checksum & 0xff])
 
-        seq = bytearray(self._SEQUENCE_SEND_CMD)
-        checksum = cmd_code + 379
-        seq.extend([cmd_code, checksum >> 8, checksum & 0xff])
-        
-        log.info(f"Sending command: '{cmd}' (code: {cmd_code})")
-        self._write(seq)
+        log.info(f"Sending command: '{cmd}'")
+        self.dev.write(frame)
         # After a command, the device might send a response packet, which needs to be "absorbed"
         self._read_packet(timeout=0.2) 
 
@@ -144,10 +279,57 @@ class UT61EPLUS:
         log.info("Connection to device closed.")
 
 def data_collector(dmm, data_queue, stop_event):
-    """This function runs in a separate thread and only collects data."""
+    """This function runs in a separate thread and only collects data.
+
+    `data_queue` is a collections.deque: append/popleft are thread-safe
+    at C level, so no lock is taken per sample.
+    """
     log.info("Data collection thread started.")
     while not stop_event.is_set():
         measurement = dmm.take_measurement()
         if measurement:
-            data_queue.put(measurement.to_dict())
+            data_queue.append(measurement.to_row())
     log.info("Data collection thread stopped.")
+
+def io_collector(dmm, raw_queue, stop_event):
+    """I/O stage of the three-thread pipeline: USB traffic only.
+
+    Requests one measurement at a time and moves raw UART chunks into
+    `raw_queue` without touching the packet parser, so this thread
+    spends nearly all its time inside hidapi with the GIL released.
+    """
+    log.info("I/O thread started.")
+    while not stop_event.is_set():
+        dmm.dev.write(dmm._DATA_FRAME)
+        deadline = time.monotonic() + 0.05
+        received = 0
+        while received < dmm._MEASUREMENT_FRAME_LEN and time.monotonic() < deadline:
+            raw = dmm.dev.read(64)
+            if raw and raw[0]:
+                chunk = bytes(raw[1:1 + raw[0]])
+                raw_queue.append(chunk)
+                received += len(chunk)
+            elif not raw:
+                time.sleep(0.001)
+    log.info("I/O thread stopped.")
+
+def packet_decoder(dmm, raw_queue, decoded_queue, stop_event):
+    """Decode stage of the pipeline: raw chunks in, MeasurementRow out.
+
+    Owns the framing parser exclusively, so parser state needs no
+    locking; the GUI thread only ever touches `decoded_queue`.
+    """
+    log.info("Decoder thread started.")
+    while not stop_event.is_set():
+        if not raw_queue:
+            time.sleep(0.001)
+            continue
+        while raw_queue:
+            dmm.read_buffer.extend(raw_queue.popleft())
+        while True:
+            payload = dmm._try_parse()
+            if payload is None:
+                break
+            if len(payload) == 16:
+                decoded_queue.append(Measurement(payload[:-2]).to_row())
+    log.info("Decoder thread stopped.")